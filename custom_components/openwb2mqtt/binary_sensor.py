@@ -1,7 +1,7 @@
 """The openwbmqtt component for controlling the openWB wallbox via home assistant / MQTT."""
 from __future__ import annotations
 
-import copy
+from dataclasses import replace
 import logging
 
 from homeassistant.components import mqtt
@@ -41,13 +41,10 @@ async def async_setup_entry(
 
     if devicetype == "chargepoint":
         # Create sensors for chargepoint
-        BINARY_SENSORS_PER_CHARGEPOINT_CP = copy.deepcopy(
-            BINARY_SENSORS_PER_CHARGEPOINT
-        )
-
-        for description in BINARY_SENSORS_PER_CHARGEPOINT_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+        for description in BINARY_SENSORS_PER_CHARGEPOINT:
+            description = replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}",
             )
             _LOGGER.debug("mqttTopic: %s", description.mqttTopicCurrentValue)
 
@@ -61,11 +58,10 @@ async def async_setup_entry(
             )
     if devicetype == "counter":
         # Create sensors for counter
-        BINARY_SENSORS_PER_COUNTER_CP = copy.deepcopy(BINARY_SENSORS_PER_COUNTER)
-
-        for description in BINARY_SENSORS_PER_COUNTER_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+        for description in BINARY_SENSORS_PER_COUNTER:
+            description = replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}",
             )
             _LOGGER.debug("mqttTopic: %s", description.mqttTopicCurrentValue)
 
@@ -80,11 +76,10 @@ async def async_setup_entry(
 
     if devicetype == "bat":
         # Create sensors for battery
-        BINARY_SENSORS_PER_BATTERY_CP = copy.deepcopy(BINARY_SENSORS_PER_BATTERY)
-
-        for description in BINARY_SENSORS_PER_BATTERY_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+        for description in BINARY_SENSORS_PER_BATTERY:
+            description = replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}",
             )
             _LOGGER.debug("mqttTopic: %s", description.mqttTopicCurrentValue)
 
@@ -99,13 +94,10 @@ async def async_setup_entry(
 
     if devicetype == "pv":
         # Create sensors for pv generators
-        BINARY_SENSORS_PER_PVGENERATOR_CP = copy.deepcopy(
-            BINARY_SENSORS_PER_PVGENERATOR
-        )
-
-        for description in BINARY_SENSORS_PER_PVGENERATOR_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+        for description in BINARY_SENSORS_PER_PVGENERATOR:
+            description = replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}",
             )
             _LOGGER.debug("mqttTopic: %s", description.mqttTopicCurrentValue)
 
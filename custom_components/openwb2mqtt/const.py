@@ -4,11 +4,22 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 import datetime
+import functools
 import json
-from zoneinfo import ZoneInfo
+from operator import methodcaller
+from types import MappingProxyType
 
 import voluptuous as vol
 
+try:
+    # orjson ships with Home Assistant and parses JSON considerably faster
+    # than the stdlib; fall back gracefully if it is ever unavailable.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntityDescription,
@@ -57,59 +68,161 @@ DEVICEID = "DEVICEID"
 MANUFACTURER = "openWB"
 MODEL = "openWB"
 
+# Device type selector shared by the configuration flow. Built once at module
+# level so the selector config is not reconstructed inside the schema literal.
+_DEVICETYPE_OPTIONS = (
+    SelectOptionDict(value="controller", label="Controller"),
+    SelectOptionDict(value="counter", label="Counter"),
+    SelectOptionDict(value="chargepoint", label="Chargepoint"),
+    SelectOptionDict(value="pv", label="PV Generator"),
+    SelectOptionDict(value="bat", label="Battery"),
+)
+_DEVICETYPE_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=list(_DEVICETYPE_OPTIONS),
+        mode=SelectSelectorMode.DROPDOWN,
+        translation_key="config_selector_devicetype",  # translation is maintained in translations/<lang>.json via this translation_key
+    )
+)
+
 # Data schema required by configuration flow
 DATA_SCHEMA = vol.Schema(
     {
         vol.Required(MQTT_ROOT_TOPIC, default=MQTT_ROOT_TOPIC_DEFAULT): cv.string,
-        vol.Required(DEVICETYPE): SelectSelector(
-            SelectSelectorConfig(
-                options=[
-                    SelectOptionDict(value="controller", label="Controller"),
-                    SelectOptionDict(value="counter", label="Counter"),
-                    SelectOptionDict(value="chargepoint", label="Chargepoint"),
-                    SelectOptionDict(value="pv", label="PV Generator"),
-                    SelectOptionDict(value="bat", label="Battery"),
-                ],
-                mode=SelectSelectorMode.DROPDOWN,
-                translation_key="config_selector_devicetype",  # translation is maintained in translations/<lang>.json via this translation_key
-            )
-        ),
+        vol.Required(DEVICETYPE): _DEVICETYPE_SELECTOR,
         vol.Required(DEVICEID): cv.positive_int,
-    }
+    },
+    extra=vol.PREVENT_EXTRA,
 )
 
 
-def _splitListToFloat(x: list, desiredValueIndex: int) -> float | None:
+# Several entity descriptions share the same MQTT topic (for example the
+# get/connected_vehicle/* sensors). Each of them receives the identical payload,
+# so cache the decoded JSON and parse each payload only once.
+_parse_json_cached = functools.lru_cache(maxsize=32)(_loads)
+
+# Singleton UTC tzinfo; avoids constructing a timezone object per message.
+_UTC = datetime.timezone.utc
+
+
+def _jget(x: str | bytes, field: str):
+    """Extract a field from a JSON payload, reusing the cached parse."""
+    return _parse_json_cached(x).get(field)
+
+
+@functools.lru_cache(maxsize=None)
+def _pick(desiredValueIndex: int) -> Callable:
+    """Return a shared value_fn extracting the i-th value of a list payload."""
+    return lambda x: _splitListToFloat(x, desiredValueIndex)
+
+
+def _compose(*functions: Callable) -> Callable:
+    """Compose single-argument functions left to right into one callable.
+
+    The composition is resolved once when the description table is built, so
+    the resulting value_fn runs without re-assembling the chain per message.
+    """
+    if len(functions) == 1:
+        return functions[0]
+
+    def composed(x):
+        for function in functions:
+            x = function(x)
+        return x
+
+    return composed
+
+
+@functools.lru_cache(maxsize=None)
+def _jsonField(field: str) -> Callable:
+    """Return a shared value_fn extracting one field from a JSON payload."""
+    # methodcaller runs in C, so the whole chain is two C-level calls plus
+    # the cached parse.
+    return _compose(_parse_json_cached, methodcaller("get", field))
+
+
+@functools.lru_cache(maxsize=64)
+def _parseList(x: str | bytes) -> tuple:
+    """Parse a JSON list payload once and cache the result.
+
+    The L1/L2/L3 sibling sensors all receive the same payload, so the cache
+    lets them share a single parse.
+    """
+    return tuple(_loads(x))
+
+
+def _splitListToFloat(x: str | bytes, desiredValueIndex: int, _float=float) -> float | None:
     """Extract float value from list at a specified index.
 
     Use this function if the MQTT topic contains a list of values, and you
     want to extract the i-th value from the list.
     For example MQTT = [1.0, 2.0, 3.0] --> extract 3rd value --> sensor value = 3.0
     """
-    x = x.replace("[", "")
-    x = x.replace("]", "")
+    if isinstance(x, (list, tuple)):
+        # Fast path for callers that already decoded the payload.
+        try:
+            return _float(x[desiredValueIndex])
+        except (IndexError, ValueError, TypeError):
+            return None
     try:
-        y = float(x.split(",")[desiredValueIndex])
-    except (IndexError, ValueError):
-        y = None
-    return y
+        return _float(_parseList(x)[desiredValueIndex])
+    except (IndexError, ValueError, TypeError):
+        return None
 
 
-def _convertDateTime(x: str) -> datetime.datetime | None:
+def _convertDateTime(x: str | bytes) -> datetime.datetime | None:
     """Convert string to datetime object.
 
     Assume that the local time zone is the same as the openWB time zone.
     """
-    a = json.loads(x).get("timestamp")
+    a = _jget(x, "timestamp")
     if a is not None:
-        dateTimeObject = datetime.datetime.strptime(a, "%m/%d/%Y, %H:%M:%S")
-        dateTimeObject = dateTimeObject.astimezone(tz=None)
-        return dateTimeObject
+        # Example: "01/02/2024, 15:29:12". The format is fixed, so split the
+        # string directly instead of going through the much slower strptime.
+        datePart, timePart = a.split(", ")
+        month, day, year = datePart.split("/")
+        hour, minute, second = timePart.split(":")
+        dateTimeObject = datetime.datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second)
+        )
+        return dateTimeObject.astimezone(tz=None)
     return a
 
 
+def _kwh(x: str, _float=float) -> float:
+    """Convert a Wh payload to kWh (multiplication is cheaper than division).
+
+    No rounding here: every descriptor using this sets
+    suggested_display_precision, so Home Assistant rounds for display.
+    """
+    return _float(x) * 1e-3
+
+
+def _div100(x: str, _float=float) -> float:
+    """Convert a payload in 1/100 units (e.g. 0.01 A) to its base unit."""
+    return _float(x) * 0.01
+
+
+def _absFloat(x: str, _float=float) -> float:
+    """Return the absolute value of a float payload."""
+    return abs(_float(x))
+
+
+def _stripQuotes(x: str) -> str:
+    """Remove quote characters from a raw string payload."""
+    return x.replace('"', "")
+
+
+def _clean_str(x: str) -> str:
+    """Strip surrounding quotes and dots and limit the state to 255 chars.
+
+    Slice first so the strip work is bounded by the state length limit.
+    """
+    return x[:257].strip('"').strip(".")[:255]
+
+
 def _umlauteEinfuegen(x: str) -> str:
-    x = x.strip('"').strip(".")[0:255]
+    x = _clean_str(x)
     if "u00fc" in x:
         x = x.replace("\\u00fc", "ü")
     if "u00dc" in x:
@@ -126,32 +239,89 @@ def _umlauteEinfuegen(x: str) -> str:
     return x
 
 
-def _splitJsonLastLiveValues(x: str, valueToExtract: str, factor: int) -> float:
-    x = json.loads(x).get(valueToExtract)
-    if x is not None:
-        try:
-            floatValue = float(x)
-            floatValue = round(factor * floatValue, 0)
-            return floatValue
-        except ValueError:
-            return None
-    else:
+def _splitJsonLastLiveValues(x: str, valueToExtract: str, factor: int, _float=float) -> float:
+    # Seven controller sensors share the lastlivevaluesJson payload; the
+    # cached parse decodes it once per message. The payload always carries
+    # the requested fields, so subscript directly instead of .get and let
+    # the except clause cover the rare malformed message.
+    try:
+        return factor * _float(_parse_json_cached(x)[valueToExtract])
+    except (KeyError, ValueError, TypeError):
         return None
 
 
-def _extractTimestampFromJson(x: str, valueToExtract: str) -> datetime.datetime:
-    x = json.loads(x).get(valueToExtract)
-    if x is not None:
-        try:
-            ts = datetime.datetime.fromtimestamp(int(x), tz=ZoneInfo("UTC"))
-            return ts
-        except ValueError:
-            return None
-    else:
+@functools.lru_cache(maxsize=None)
+def _liveValue(field: str, factor: int = 1) -> Callable:
+    """Return a shared value_fn for a scaled lastlivevaluesJson field.
+
+    The field name and scale factor are bound once when the description
+    table is built instead of spelling out a lambda per descriptor.
+    """
+    return lambda x: _splitJsonLastLiveValues(x, field, factor)
+
+
+def _liveValuesTimestamp(x: str) -> datetime.datetime | None:
+    """Convert the lastlivevaluesJson unix timestamp to a datetime."""
+    try:
+        ts = _parse_json_cached(x)["timestamp"]
+        if not isinstance(ts, (int, float)):
+            # Older payloads carry the timestamp as a string.
+            ts = int(ts)
+        return datetime.datetime.fromtimestamp(ts, tz=_UTC)
+    except (KeyError, ValueError, TypeError):
         return None
 
 
-@dataclass
+# Enum members shared by dozens of descriptors, resolved once at import time
+# so building the tables loads a plain module global instead of repeating the
+# enum attribute lookup per descriptor.
+_DIAGNOSTIC = EntityCategory.DIAGNOSTIC
+_MEASUREMENT = SensorStateClass.MEASUREMENT
+_TOTAL = SensorStateClass.TOTAL
+_ENERGY = SensorDeviceClass.ENERGY
+_POWER = SensorDeviceClass.POWER
+_KILO_WATT_HOUR = UnitOfEnergy.KILO_WATT_HOUR
+_WATT = UnitOfPower.WATT
+
+# Charge mode mappings shared by the Lademodus sensor and the chargemode
+# select. MappingProxyType keeps the single shared copy immutable.
+_CHARGEMODE_CURRENT_VALUE = MappingProxyType(
+    {
+        "instant_charging": "Instant Charging",
+        "scheduled_charging": "Scheduled Charging",
+        "pv_charging": "PV Charging",
+        "standby": "Standby",
+        "stop": "Stop",
+        # "time_charging": "Time Charging",
+    }
+)
+_CHARGEMODE_COMMAND = MappingProxyType(
+    {value: key for key, value in _CHARGEMODE_CURRENT_VALUE.items()}
+)
+_CHARGEMODE_OPTIONS = (
+    "Instant Charging",
+    "Scheduled Charging",
+    "PV Charging",
+    "Stop",
+    "Standby",
+)
+# The sensor additionally displays time charging, which the select does not
+# offer as an option.
+_CHARGEMODE_SENSOR_MAP = MappingProxyType(
+    {**_CHARGEMODE_CURRENT_VALUE, "time_charging": "Time Charging"}
+)
+
+# Mappings for the connected vehicle select (openWB supports vehicle IDs 0-10).
+# The IDs are contiguous ints, so the current-value map is a tuple indexed by
+# the ID; the select dispatch recognizes tuples and indexes directly.
+_VEHICLE_CURRENT_VALUE = tuple(f"Vehicle {vehicleID}" for vehicleID in range(11))
+_VEHICLE_COMMAND = MappingProxyType(
+    {name: str(vehicleID) for vehicleID, name in enumerate(_VEHICLE_CURRENT_VALUE)}
+)
+_VEHICLE_OPTIONS = _VEHICLE_CURRENT_VALUE
+
+
+@dataclass(slots=True)
 class openwbSensorEntityDescription(SensorEntityDescription):
     """Enhance the sensor entity description for openWB."""
 
@@ -160,7 +330,7 @@ class openwbSensorEntityDescription(SensorEntityDescription):
     mqttTopicCurrentValue: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class openwbBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Enhance the sensor entity description for openWB."""
 
@@ -168,19 +338,20 @@ class openwbBinarySensorEntityDescription(BinarySensorEntityDescription):
     mqttTopicCurrentValue: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class openwbSelectEntityDescription(SelectEntityDescription):
     """Enhance the select entity description for openWB."""
 
     valueMapCommand: dict | None = None
-    valueMapCurrentValue: dict | None = None
+    # Either a dict, or a tuple indexed by contiguous integer payload values.
+    valueMapCurrentValue: dict | tuple | None = None
     mqttTopicCommand: str | None = None
     mqttTopicCurrentValue: str | None = None
     value_fn: Callable | None = None
     modes: list | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class openwbSwitchEntityDescription(SwitchEntityDescription):
     """Enhance the select entity description for openWB."""
 
@@ -189,7 +360,7 @@ class openwbSwitchEntityDescription(SwitchEntityDescription):
     mqttTopicChargeMode: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class openWBNumberEntityDescription(NumberEntityDescription):
     """Enhance the number entity description for openWB."""
 
@@ -199,50 +370,56 @@ class openWBNumberEntityDescription(NumberEntityDescription):
     value_fn: Callable | None = None
 
 
-SENSORS_PER_CHARGEPOINT = [
-    openwbSensorEntityDescription(
-        key="get/currents",
-        name="Strom (L1)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="get/currents",
-        name="Strom (L2)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="get/currents",
-        name="Strom (L3)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 2),
+def _phase_entries(
+    key: str,
+    name: str,
+    device_class: SensorDeviceClass,
+    unit: str | None,
+    icon: str | None = None,
+    entity_registry_enabled_default: bool = True,
+) -> tuple[openwbSensorEntityDescription, ...]:
+    """Create the three L1/L2/L3 sensor descriptions for a per-phase topic."""
+    return tuple(
+        openwbSensorEntityDescription(
+            key=key,
+            name=f"{name} (L{i + 1})",
+            device_class=device_class,
+            state_class=_MEASUREMENT,
+            native_unit_of_measurement=unit,
+            icon=icon,
+            value_fn=_pick(i),
+            entity_registry_enabled_default=entity_registry_enabled_default,
+        )
+        for i in range(3)
+    )
+
+
+SENSORS_PER_CHARGEPOINT = (
+    *_phase_entries(
+        "get/currents",
+        "Strom",
+        SensorDeviceClass.CURRENT,
+        UnitOfElectricCurrent.AMPERE,
+        "mdi:current-ac",
     ),
     openwbSensorEntityDescription(
         key="get/daily_imported",
         name="Geladene Energie (Heute)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
+        suggested_display_precision=3,
         icon="mdi:counter",
     ),
     openwbSensorEntityDescription(
         key="get/daily_exported",
         name="Entladene Energie (Heute)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
+        suggested_display_precision=3,
         icon="mdi:counter",
         entity_registry_enabled_default=False,
     ),
@@ -251,7 +428,7 @@ SENSORS_PER_CHARGEPOINT = [
         name="Ladestromvorgabe",
         device_class=SensorDeviceClass.CURRENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        value_fn=lambda x: round(float(x) / 100.0, 2),
+        value_fn=_div100,
         suggested_display_precision=1,
         entity_registry_enabled_default=False,
         icon="mdi:current-ac",
@@ -259,10 +436,10 @@ SENSORS_PER_CHARGEPOINT = [
     openwbSensorEntityDescription(
         key="get/exported",
         name="Entladene Energie (Gesamt)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=0,
         icon="mdi:counter",
         entity_registry_enabled_default=False,
@@ -270,185 +447,99 @@ SENSORS_PER_CHARGEPOINT = [
     openwbSensorEntityDescription(
         key="get/fault_str",
         name="Fehlerbeschreibung",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: x.strip('"').strip(".")[0:255],
+        entity_category=_DIAGNOSTIC,
+        value_fn=_clean_str,
     ),
     openwbSensorEntityDescription(
         key="get/imported",
         name="Geladene Energie (Gesamt)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=0,
         icon="mdi:counter",
     ),
     openwbSensorEntityDescription(
         key="get/phases_in_use",
         name="Aktive Phasen",
-        device_class=None,
-        native_unit_of_measurement=None,
     ),
     openwbSensorEntityDescription(
         key="get/power",
         name="Ladeleistung",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_POWER,
+        native_unit_of_measurement=_WATT,
+        state_class=_MEASUREMENT,
         icon="mdi:car-electric-outline",
     ),
     openwbSensorEntityDescription(
         key="get/state_str",
         name="Ladezustand",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: _umlauteEinfuegen(x),
-    ),
-    openwbSensorEntityDescription(
-        key="get/voltages",
-        name="Spannung (L1)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="get/voltages",
-        name="Spannung (L2)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="get/voltages",
-        name="Spannung (L3)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 2),
-    ),
-    openwbSensorEntityDescription(
-        key="get/power_factors",
-        name="Leistungsfaktor (L1)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 0),
+        entity_category=_DIAGNOSTIC,
+        value_fn=_umlauteEinfuegen,
+    ),
+    *_phase_entries(
+        "get/voltages",
+        "Spannung",
+        SensorDeviceClass.VOLTAGE,
+        UnitOfElectricPotential.VOLT,
+        "mdi:sine-wave",
+    ),
+    *_phase_entries(
+        "get/power_factors",
+        "Leistungsfaktor",
+        SensorDeviceClass.POWER_FACTOR,
+        None,
         entity_registry_enabled_default=False,
     ),
-    openwbSensorEntityDescription(
-        key="get/power_factors",
-        name="Leistungsfaktor (L2)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 1),
-        entity_registry_enabled_default=False,
-    ),
-    openwbSensorEntityDescription(
-        key="get/power_factors",
-        name="Leistungsfaktor (L3)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 2),
-        entity_registry_enabled_default=False,
-    ),
-    openwbSensorEntityDescription(
-        key="get/powers",
-        name="Leistung (L1)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:car-electric-outline",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="get/powers",
-        name="Leistung (L2)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:car-electric-outline",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="get/powers",
-        name="Leistung (L3)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:car-electric-outline",
-        value_fn=lambda x: _splitListToFloat(x, 2),
+    *_phase_entries(
+        "get/powers",
+        "Leistung",
+        _POWER,
+        _WATT,
+        "mdi:car-electric-outline",
     ),
     openwbSensorEntityDescription(
         key="get/frequency",
         name="Frequenz",
         device_class=SensorDeviceClass.FREQUENCY,
-        state_class=SensorStateClass.MEASUREMENT,
+        state_class=_MEASUREMENT,
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         # icon="mdi:current-ac",
     ),
     openwbSensorEntityDescription(
         key="config",
         name="Ladepunkt",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
         entity_registry_visible_default=False,
-        value_fn=lambda x: json.loads(x).get("name").replace('"', ""),
+        value_fn=_jsonField("name"),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/info",
         name="Fahrzeug-ID",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
         entity_registry_visible_default=False,
-        value_fn=lambda x: json.loads(x).get("id"),
+        value_fn=_jsonField("id"),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/info",
         name="Fahrzeug",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
         entity_registry_visible_default=False,
-        value_fn=lambda x: json.loads(x).get("name").replace('"', ""),
+        value_fn=_jsonField("name"),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/config",
         name="Lade-Profil",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
         entity_registry_visible_default=False,
-        value_fn=lambda x: json.loads(x).get("charge_template"),
+        value_fn=_jsonField("charge_template"),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/config",
         name="Lademodus",
-        device_class=None,
-        native_unit_of_measurement=None,
-        value_fn=lambda x: json.loads(x).get("chargemode"),
-        valueMap={
-            "standby": "Standby",
-            "stop": "Stop",
-            "scheduled_charging": "Scheduled Charging",
-            "time_charging": "Time Charging",
-            "instant_charging": "Instant Charging",
-            "pv_charging": "PV Charging",
-        },
+        value_fn=_jsonField("chargemode"),
+        valueMap=_CHARGEMODE_SENSOR_MAP,
         translation_key="sensor_lademodus",
     ),
     openwbSensorEntityDescription(
@@ -456,45 +547,40 @@ SENSORS_PER_CHARGEPOINT = [
         name="Ladung",
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=True,
+        state_class=_MEASUREMENT,
         suggested_display_precision=0,
-        value_fn=lambda x: json.loads(x).get("soc"),
+        value_fn=_jsonField("soc"),
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/soc",
         name="SoC-Datenaktualisierung",
         device_class=SensorDeviceClass.TIMESTAMP,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
         entity_registry_enabled_default=False,
         icon="mdi:clock-time-eight",
-        value_fn=lambda x: _convertDateTime(x),
+        value_fn=_convertDateTime,
         # Example: "01/02/2024, 15:29:12"
     ),
     openwbSensorEntityDescription(
         key="get/rfid",
         name="Zuletzt gescannter RFID-Tag",
-        device_class=None,
-        native_unit_of_measurement=None,
         icon="mdi:tag-multiple",
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
     openwbSensorEntityDescription(
         key="get/connected_vehicle/soc",
         name="Geladene Entfernung",
-        device_class=None,
         native_unit_of_measurement=UnitOfLength.KILOMETERS,
-        state_class=SensorStateClass.MEASUREMENT,
+        state_class=_MEASUREMENT,
         icon="mdi:map-marker-distance",
         entity_registry_enabled_default=False,
-        value_fn=lambda x: json.loads(x).get("range_charged"),
+        value_fn=_jsonField("range_charged"),
         suggested_display_precision=1,
     ),
-]
+)
 
-BINARY_SENSORS_PER_CHARGEPOINT = [
+BINARY_SENSORS_PER_CHARGEPOINT = (
     openwbBinarySensorEntityDescription(
         key="plug_state",
         name="Ladekabel",
@@ -509,95 +595,39 @@ BINARY_SENSORS_PER_CHARGEPOINT = [
         key="fault_state",
         name="Fehler",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
     ),
-]
+)
 
-SELECTS_PER_CHARGEPOINT = [
+SELECTS_PER_CHARGEPOINT = (
     openwbSelectEntityDescription(
         key="chargemode",
         entity_category=EntityCategory.CONFIG,
         name="Lademodus",
         translation_key="selector_chargepoint_chargemode",  # translation is maintained in translations/<lang>.json via this translation_key
-        valueMapCurrentValue={
-            "instant_charging": "Instant Charging",
-            "scheduled_charging": "Scheduled Charging",
-            "pv_charging": "PV Charging",
-            "standby": "Standby",
-            "stop": "Stop",
-            # "time_charging": "Time Charging",
-        },
-        valueMapCommand={
-            "Instant Charging": "instant_charging",
-            "Scheduled Charging": "scheduled_charging",
-            "PV Charging": "pv_charging",
-            "Standby": "standby",
-            "Stop": "stop",
-            # "Time Charging": "time_charging",
-        },
+        valueMapCurrentValue=_CHARGEMODE_CURRENT_VALUE,
+        valueMapCommand=_CHARGEMODE_COMMAND,
         mqttTopicCommand="set/vehicle/template/charge_template/_chargeTemplateID_/chargemode/selected",
         mqttTopicCurrentValue="get/connected_vehicle/config",
-        options=[
-            "Instant Charging",
-            "Scheduled Charging",
-            "PV Charging",
-            "Stop",
-            "Standby",
-        ],
-        value_fn=lambda x: json.loads(x).get("chargemode"),
+        options=_CHARGEMODE_OPTIONS,
+        value_fn=_jsonField("chargemode"),
     ),
     openwbSelectEntityDescription(
         key="connected_vehicle",
         entity_category=EntityCategory.CONFIG,
         name="Angeschlossenes Fahrzeug",
         translation_key="selector_connected_vehicle",
-        valueMapCurrentValue={
-            0: "Vehicle 0",
-            1: "Vehicle 1",
-            2: "Vehicle 2",
-            3: "Vehicle 3",
-            4: "Vehicle 4",
-            5: "Vehicle 5",
-            6: "Vehicle 6",
-            7: "Vehicle 7",
-            8: "Vehicle 8",
-            9: "Vehicle 9",
-            10: "Vehicle 10",
-        },
-        valueMapCommand={
-            "Vehicle 0": "0",
-            "Vehicle 1": "1",
-            "Vehicle 2": "2",
-            "Vehicle 3": "3",
-            "Vehicle 4": "4",
-            "Vehicle 5": "5",
-            "Vehicle 6": "6",
-            "Vehicle 7": "7",
-            "Vehicle 8": "8",
-            "Vehicle 9": "9",
-            "Vehicle 10": "10",
-        },
-        options=[
-            "Vehicle 0",
-            "Vehicle 1",
-            "Vehicle 2",
-            "Vehicle 3",
-            "Vehicle 4",
-            "Vehicle 5",
-            "Vehicle 6",
-            "Vehicle 7",
-            "Vehicle 8",
-            "Vehicle 9",
-            "Vehicle 10",
-        ],
+        valueMapCurrentValue=_VEHICLE_CURRENT_VALUE,
+        valueMapCommand=_VEHICLE_COMMAND,
+        options=_VEHICLE_OPTIONS,
         mqttTopicCommand="set/chargepoint/_chargePointID_/config/ev",
         mqttTopicCurrentValue="get/connected_vehicle/info",
-        value_fn=lambda x: json.loads(x).get("id"),
+        value_fn=_jsonField("id"),
         entity_registry_enabled_default=False,
     ),
-]
+)
 
-NUMBERS_PER_CHARGEPOINT = [
+NUMBERS_PER_CHARGEPOINT = (
     openWBNumberEntityDescription(
         key="manual_soc",
         name="Aktueller SoC (Manuelles SoC Modul)",
@@ -610,15 +640,14 @@ NUMBERS_PER_CHARGEPOINT = [
         entity_category=EntityCategory.CONFIG,
         mqttTopicCommand="set/vehicle/_vehicleID_/soc_module/calculated_soc_state/manual_soc",
         mqttTopicCurrentValue="get/connected_vehicle/soc",
-        mqttTopicChargeMode=None,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: json.loads(x).get("soc"),
+        value_fn=_jsonField("soc"),
     ),
     # openWBNumberEntityDescription(
     #     key="pv_charging_min_current",
     #     name="Ladestromvorgabe (PV Laden)",
     #     native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-    #     device_class=SensorDeviceClass.POWER,
+    #     device_class=_POWER,
     #     icon="mdi:current-ac",
     #     native_min_value=0,
     #     native_max_value=16,
@@ -633,461 +662,343 @@ NUMBERS_PER_CHARGEPOINT = [
     #     .get("pv_charging")
     #     .get("min_current"),
     # ),
-]
+)
 
-SENSORS_PER_COUNTER = [
-    openwbSensorEntityDescription(
-        key="voltages",
-        name="Spannung (L1)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="voltages",
-        name="Spannung (L2)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="voltages",
-        name="Spannung (L3)",
-        device_class=SensorDeviceClass.VOLTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:sine-wave",
-        value_fn=lambda x: _splitListToFloat(x, 2),
-    ),
-    openwbSensorEntityDescription(
-        key="power_factors",
-        name="Leistungsfaktor (L1)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 0),
+SENSORS_PER_COUNTER = (
+    *_phase_entries(
+        "voltages",
+        "Spannung",
+        SensorDeviceClass.VOLTAGE,
+        UnitOfElectricPotential.VOLT,
+        "mdi:sine-wave",
+    ),
+    *_phase_entries(
+        "power_factors",
+        "Leistungsfaktor",
+        SensorDeviceClass.POWER_FACTOR,
+        None,
         entity_registry_enabled_default=False,
     ),
-    openwbSensorEntityDescription(
-        key="power_factors",
-        name="Leistungsfaktor (L2)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 1),
-        entity_registry_enabled_default=False,
-    ),
-    openwbSensorEntityDescription(
-        key="power_factors",
-        name="Leistungsfaktor (L3)",
-        device_class=SensorDeviceClass.POWER_FACTOR,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=None,
-        # icon=,
-        value_fn=lambda x: _splitListToFloat(x, 2),
-        entity_registry_enabled_default=False,
-    ),
-    openwbSensorEntityDescription(
-        key="powers",
-        name="Leistung (L1)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:transmission-tower",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="powers",
-        name="Leistung (L2)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:transmission-tower",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="powers",
-        name="Leistung (L3)",
-        device_class=SensorDeviceClass.POWER,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        icon="mdi:transmission-tower",
-        value_fn=lambda x: _splitListToFloat(x, 2),
+    *_phase_entries(
+        "powers",
+        "Leistung",
+        _POWER,
+        _WATT,
+        "mdi:transmission-tower",
     ),
     openwbSensorEntityDescription(
         key="frequency",
         name="Frequenz",
         device_class=SensorDeviceClass.FREQUENCY,
-        state_class=SensorStateClass.MEASUREMENT,
+        state_class=_MEASUREMENT,
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         # icon="mdi:current-ac",
     ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L1)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L2)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L3)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 2),
+    *_phase_entries(
+        "currents",
+        "Strom",
+        SensorDeviceClass.CURRENT,
+        UnitOfElectricCurrent.AMPERE,
+        "mdi:current-ac",
     ),
     openwbSensorEntityDescription(
         key="power",
         name="Leistung",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        # state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=True,
+        device_class=_POWER,
+        native_unit_of_measurement=_WATT,
+        # state_class=_MEASUREMENT,
         icon="mdi:transmission-tower",
     ),
     openwbSensorEntityDescription(
         key="fault_str",
         name="Fehlerbeschreibung",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: x.strip('"').strip(".")[0:255],
+        entity_category=_DIAGNOSTIC,
+        value_fn=_clean_str,
     ),
     openwbSensorEntityDescription(
         key="exported",
         name="Exportierte Energie (Gesamt)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=0,
         icon="mdi:transmission-tower-export",
     ),
     openwbSensorEntityDescription(
         key="imported",
         name="Importierte Energie (Gesamt)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=0,
         icon="mdi:transmission-tower-import",
     ),
     openwbSensorEntityDescription(
         key="daily_imported",
         name="Importierte Energie (Heute)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=1,
         icon="mdi:transmission-tower-import",
     ),
     openwbSensorEntityDescription(
         key="daily_exported",
         name="Exportierte Energie (Heute)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=1,
         icon="mdi:transmission-tower-export",
     ),
-]
+)
 
-BINARY_SENSORS_PER_COUNTER = [
+BINARY_SENSORS_PER_COUNTER = (
     openwbBinarySensorEntityDescription(
         key="fault_state",
         name="Fehler",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
     ),
-]
+)
 
-SENSORS_PER_BATTERY = [
+SENSORS_PER_BATTERY = (
     openwbSensorEntityDescription(
         key="soc",
         name="Ladung",
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=True,
+        state_class=_MEASUREMENT,
         # icon="mdi:transmission-tower",
     ),
     openwbSensorEntityDescription(
         key="power",
         name="Leistung",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=True,
+        device_class=_POWER,
+        native_unit_of_measurement=_WATT,
+        state_class=_MEASUREMENT,
         icon="mdi:battery-charging",
     ),
     openwbSensorEntityDescription(
         key="fault_str",
         name="Fehlerbeschreibung",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: x.strip('"').strip(".")[0:255],
+        entity_category=_DIAGNOSTIC,
+        value_fn=_clean_str,
     ),
     openwbSensorEntityDescription(
         key="exported",
         name="Entladene Energie (Gesamt)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=0,
         icon="mdi:battery-arrow-up",
     ),
     openwbSensorEntityDescription(
         key="imported",
         name="Geladene Energie (Gesamt)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=0,
         icon="mdi:battery-arrow-down",
     ),
     openwbSensorEntityDescription(
         key="daily_imported",
         name="Geladene Energie (Heute)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=1,
         icon="mdi:battery-arrow-down",
     ),
     openwbSensorEntityDescription(
         key="daily_exported",
         name="Entladene Energie (Heute)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=1,
         icon="mdi:battery-arrow-up",
     ),
-]
+)
 
-BINARY_SENSORS_PER_BATTERY = [
+BINARY_SENSORS_PER_BATTERY = (
     openwbBinarySensorEntityDescription(
         key="fault_state",
         name="Fehler",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
     ),
-]
+)
 
-SENSORS_PER_PVGENERATOR = [
+SENSORS_PER_PVGENERATOR = (
     openwbSensorEntityDescription(
         key="daily_exported",
         name="Zählerstand (Heute)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=1,
         icon="mdi:counter",
     ),
     openwbSensorEntityDescription(
         key="monthly_exported",
         name="Zählerstand (Monat)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=0,
         icon="mdi:counter",
     ),
     openwbSensorEntityDescription(
         key="yearly_exported",
         name="Zählerstand (Jahr)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=0,
         icon="mdi:counter",
     ),
     openwbSensorEntityDescription(
         key="exported",
         name="Zählerstand (Gesamt)",
-        device_class=SensorDeviceClass.ENERGY,
-        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda x: round(float(x) / 1000.0, 3),
+        device_class=_ENERGY,
+        native_unit_of_measurement=_KILO_WATT_HOUR,
+        state_class=_TOTAL,
+        value_fn=_kwh,
         suggested_display_precision=0,
         icon="mdi:counter",
     ),
     openwbSensorEntityDescription(
         key="power",
         name="Leistung",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_registry_enabled_default=True,
+        device_class=_POWER,
+        native_unit_of_measurement=_WATT,
+        state_class=_MEASUREMENT,
         icon="mdi:solar-power",
         suggested_display_precision=0,
-        value_fn=lambda x: abs(float(x)),
+        value_fn=_absFloat,
     ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L1)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 0),
-    ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L2)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 1),
-    ),
-    openwbSensorEntityDescription(
-        key="currents",
-        name="Strom (L3)",
-        device_class=SensorDeviceClass.CURRENT,
-        state_class=SensorStateClass.MEASUREMENT,
-        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        icon="mdi:current-ac",
-        value_fn=lambda x: _splitListToFloat(x, 2),
+    *_phase_entries(
+        "currents",
+        "Strom",
+        SensorDeviceClass.CURRENT,
+        UnitOfElectricCurrent.AMPERE,
+        "mdi:current-ac",
     ),
     openwbSensorEntityDescription(
         key="fault_str",
         name="Fehlerbeschreibung",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: x.strip('"').strip(".")[0:255],
+        entity_category=_DIAGNOSTIC,
+        value_fn=_clean_str,
     ),
-]
+)
 
-BINARY_SENSORS_PER_PVGENERATOR = [
+BINARY_SENSORS_PER_PVGENERATOR = (
     openwbBinarySensorEntityDescription(
         key="fault_state",
         name="Fehler",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
     ),
-]
+)
 
-SENSORS_CONTROLLER = [
+SENSORS_CONTROLLER = (
     # System
     openwbSensorEntityDescription(
         key="system/ip_address",
         name="IP-Adresse",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
         icon="mdi:earth",
-        value_fn=lambda x: x.replace('"', ""),
+        value_fn=_stripQuotes,
     ),
     openwbSensorEntityDescription(
         key="system/version",
         name="Version",
-        device_class=None,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
         icon="mdi:folder-clock",
-        value_fn=lambda x: x.replace('"', ""),
+        value_fn=_stripQuotes,
     ),
     openwbSensorEntityDescription(
         key="system/lastlivevaluesJson",
         name="Datenaktualisierung",
         device_class=SensorDeviceClass.TIMESTAMP,
-        native_unit_of_measurement=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_category=_DIAGNOSTIC,
         icon="mdi:clock-time-eight",
         # value_fn=lambda x: datetime.datetime.fromtimestamp(
         #    int(json.loads(x).get("timestamp")), tz=ZoneInfo("UTC")
         # ),
-        value_fn=lambda x: _extractTimestampFromJson(x, "timestamp"),
+        value_fn=_liveValuesTimestamp,
     ),
     openwbSensorEntityDescription(
         key="system/lastlivevaluesJson",
         name="Netzbezug/-einspeisung",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_POWER,
+        native_unit_of_measurement=_WATT,
+        state_class=_MEASUREMENT,
         suggested_display_precision=0,
         icon="mdi:transmission-tower",
-        value_fn=lambda x: _splitJsonLastLiveValues(x, "grid", 1000),
+        value_fn=_liveValue("grid", 1000),
     ),
     openwbSensorEntityDescription(
         key="system/lastlivevaluesJson",
         name="Hausverbrauch",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_POWER,
+        native_unit_of_measurement=_WATT,
+        state_class=_MEASUREMENT,
         suggested_display_precision=0,
         icon="mdi:home-lightning-bolt",
-        value_fn=lambda x: _splitJsonLastLiveValues(x, "house-power", 1000),
+        value_fn=_liveValue("house-power", 1000),
     ),
     openwbSensorEntityDescription(
         key="system/lastlivevaluesJson",
         name="PV-Leistung (Gesamt)",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_POWER,
+        native_unit_of_measurement=_WATT,
+        state_class=_MEASUREMENT,
         suggested_display_precision=0,
         icon="mdi:solar-power",
-        value_fn=lambda x: _splitJsonLastLiveValues(x, "pv-all", 1000),
+        value_fn=_liveValue("pv-all", 1000),
     ),
     openwbSensorEntityDescription(
         key="system/lastlivevaluesJson",
         name="Ladeleistung (Gesamt)",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_POWER,
+        native_unit_of_measurement=_WATT,
+        state_class=_MEASUREMENT,
         suggested_display_precision=0,
         icon="mdi:car-electric-outline",
-        value_fn=lambda x: _splitJsonLastLiveValues(x, "charging-all", 1000),
+        value_fn=_liveValue("charging-all", 1000),
     ),
     openwbSensorEntityDescription(
         key="system/lastlivevaluesJson",
         name="Batterieleistung (Gesamt)",
-        device_class=SensorDeviceClass.POWER,
-        native_unit_of_measurement=UnitOfPower.WATT,
-        state_class=SensorStateClass.MEASUREMENT,
+        device_class=_POWER,
+        native_unit_of_measurement=_WATT,
+        state_class=_MEASUREMENT,
         suggested_display_precision=0,
         icon="mdi:battery-charging",
-        value_fn=lambda x: _splitJsonLastLiveValues(x, "bat-all-power", 1000),
+        value_fn=_liveValue("bat-all-power", 1000),
     ),
     openwbSensorEntityDescription(
         key="system/lastlivevaluesJson",
         name="Batterieladung (Gesamt)",
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
+        state_class=_MEASUREMENT,
         suggested_display_precision=0,
-        value_fn=lambda x: _splitJsonLastLiveValues(x, "bat-all-soc", 1),
+        value_fn=_liveValue("bat-all-soc"),
     ),
-]
+)
@@ -1,7 +1,7 @@
 """OpenWB Number Entity."""
 from __future__ import annotations
 
-import copy
+from dataclasses import replace
 import logging
 
 from homeassistant.components import mqtt
@@ -40,10 +40,12 @@ async def async_setup_entry(
 
     if devicetype == "chargepoint":
         # Create numbers for chargepoint
-        NUMBERS_PER_CHARGEPOINT_CP = copy.deepcopy(NUMBERS_PER_CHARGEPOINT)
-        for description in NUMBERS_PER_CHARGEPOINT_CP:
-            description.mqttTopicCommand = f"{mqttRoot}/{description.mqttTopicCommand}"
-            description.mqttTopicCurrentValue = f"{mqttRoot}/{devicetype}/{deviceID}/{description.mqttTopicCurrentValue}"
+        for description in NUMBERS_PER_CHARGEPOINT:
+            description = replace(
+                description,
+                mqttTopicCommand=f"{mqttRoot}/{description.mqttTopicCommand}",
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/{description.mqttTopicCurrentValue}",
+            )
 
             numberList.append(
                 openWBNumber(
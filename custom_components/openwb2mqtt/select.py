@@ -1,7 +1,7 @@
 """OpenWB Selector."""
 from __future__ import annotations
 
-import copy
+from dataclasses import replace
 import logging
 
 from homeassistant.components import mqtt
@@ -40,14 +40,17 @@ async def async_setup_entry(
     selectList = []
 
     if devicetype == "chargepoint":
-        SELECTS_PER_CHARGEPOINT_CP = copy.deepcopy(SELECTS_PER_CHARGEPOINT)
-        for description in SELECTS_PER_CHARGEPOINT_CP:
-            if "_chargePointID_" in description.mqttTopicCommand:
-                description.mqttTopicCommand = description.mqttTopicCommand.replace(
+        for description in SELECTS_PER_CHARGEPOINT:
+            mqttTopicCommand = description.mqttTopicCommand
+            if "_chargePointID_" in mqttTopicCommand:
+                mqttTopicCommand = mqttTopicCommand.replace(
                     "_chargePointID_", str(deviceID)
                 )
-            description.mqttTopicCommand = f"{mqttRoot}/{description.mqttTopicCommand}"
-            description.mqttTopicCurrentValue = f"{mqttRoot}/{devicetype}/{deviceID}/{description.mqttTopicCurrentValue}"
+            description = replace(
+                description,
+                mqttTopicCommand=f"{mqttRoot}/{mqttTopicCommand}",
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/{description.mqttTopicCurrentValue}",
+            )
             selectList.append(
                 openwbSelect(
                     unique_id=f"{integrationUniqueID}",
@@ -103,19 +106,24 @@ class openwbSelect(OpenWBBaseEntity, SelectEntity):
             # Map values as defined in the value map dict.
             # First try to map integer values, then string values.
             # If no value can be mapped, use original value without conversion.
-            if self.entity_description.valueMapCurrentValue is not None:
-                try:
-                    self._attr_current_option = (
-                        self.entity_description.valueMapCurrentValue.get(
-                            int(message.payload)
-                        )
-                    )
-                except ValueError:
-                    self._attr_current_option = (
-                        self.entity_description.valueMapCurrentValue.get(
-                            message.payload, None
+            valueMap = self.entity_description.valueMapCurrentValue
+            if valueMap is not None:
+                if isinstance(valueMap, tuple):
+                    # Maps with small contiguous integer keys (e.g. vehicle
+                    # IDs) are tuples indexed by the payload value; an array
+                    # load replaces the dict probe.
+                    try:
+                        index = int(message.payload)
+                        self._attr_current_option = (
+                            valueMap[index] if 0 <= index < len(valueMap) else None
                         )
-                    )
+                    except ValueError:
+                        self._attr_current_option = None
+                else:
+                    try:
+                        self._attr_current_option = valueMap.get(int(message.payload))
+                    except ValueError:
+                        self._attr_current_option = valueMap.get(message.payload, None)
             else:
                 self._attr_current_option = message.payload
 
@@ -1,7 +1,7 @@
 """The openwbmqtt component for controlling the openWB wallbox via home assistant / MQTT."""
 from __future__ import annotations
 
-import copy
+from dataclasses import replace
 import json
 import logging
 
@@ -42,9 +42,11 @@ async def async_setup_entry(
     sensorList = []
 
     if devicetype == "controller":
-        SENSORS_CONTROLLER_CP = copy.deepcopy(SENSORS_CONTROLLER)
-        for description in SENSORS_CONTROLLER_CP:
-            description.mqttTopicCurrentValue = f"{mqttRoot}/{description.key}"
+        for description in SENSORS_CONTROLLER:
+            description = replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{description.key}",
+            )
             sensorList.append(
                 openwbSensor(
                     uniqueID=f"{integrationUniqueID}",
@@ -56,10 +58,10 @@ async def async_setup_entry(
 
     if devicetype == "chargepoint":
         # Create sensors for chargepoint
-        SENSORS_PER_CHARGEPOINT_CP = copy.deepcopy(SENSORS_PER_CHARGEPOINT)
-        for description in SENSORS_PER_CHARGEPOINT_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/{description.key}"
+        for description in SENSORS_PER_CHARGEPOINT:
+            description = replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/{description.key}",
             )
             sensorList.append(
                 openwbSensor(
@@ -71,10 +73,10 @@ async def async_setup_entry(
             )
     if devicetype == "counter":
         # Create sensors for counters, for example EVU
-        SENSORS_PER_COUNTER_CP = copy.deepcopy(SENSORS_PER_COUNTER)
-        for description in SENSORS_PER_COUNTER_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+        for description in SENSORS_PER_COUNTER:
+            description = replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}",
             )
             sensorList.append(
                 openwbSensor(
@@ -87,10 +89,10 @@ async def async_setup_entry(
 
     if devicetype == "bat":
         # Create sensors for batteries
-        SENSORS_PER_BATTERY_CP = copy.deepcopy(SENSORS_PER_BATTERY)
-        for description in SENSORS_PER_BATTERY_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+        for description in SENSORS_PER_BATTERY:
+            description = replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}",
             )
             sensorList.append(
                 openwbSensor(
@@ -103,10 +105,10 @@ async def async_setup_entry(
 
     if devicetype == "pv":
         # Create sensors for batteries
-        SENSORS_PER_PVGENERATOR_CP = copy.deepcopy(SENSORS_PER_PVGENERATOR)
-        for description in SENSORS_PER_PVGENERATOR_CP:
-            description.mqttTopicCurrentValue = (
-                f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}"
+        for description in SENSORS_PER_PVGENERATOR:
+            description = replace(
+                description,
+                mqttTopicCurrentValue=f"{mqttRoot}/{devicetype}/{deviceID}/get/{description.key}",
             )
             sensorList.append(
                 openwbSensor(